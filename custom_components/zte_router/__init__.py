@@ -7,6 +7,7 @@ from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ZTERouterAPI
@@ -22,7 +23,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data["host"]
     password = entry.data.get("password")
     
-    api = ZTERouterAPI(host, password)
+    api = ZTERouterAPI(host, password, async_get_clientsession(hass))
     
     # Create coordinator for polling
     coordinator = DataUpdateCoordinator(
@@ -2,47 +2,169 @@
 from __future__ import annotations
 
 import hashlib
+import ipaddress
+import json
 import logging
+from time import monotonic, time_ns
 from typing import Any
 
 import aiohttp
+from yarl import URL
+
+try:
+    import aiodns  # noqa: F401
+except ImportError:
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
 
 # Unauthenticated session ID used by the router
 UNAUTHENTICATED_SESSION = "00000000000000000000000000000000"
 
+# Re-login proactively once a session is this old (seconds), before the router rejects it
+SESSION_TTL = 25 * 60
+
+# Shared request params, never mutated
+_EMPTY_PARAMS: dict[str, Any] = {}
+_DATA_USAGE_PARAMS: dict[str, Any] = {"source_module": "web", "cid": 1, "type": 4}
+
+# web_login result codes, which the router sends as either strings or ints
+_LOGIN_OK = frozenset({"0", 0})
+_LOGIN_BAD_PASSWORD = frozenset({"1", 1})
+_LOGIN_LOCKED = frozenset({"2", 2})
+
+# Fields the router reports as strings but that are numbers, cast once per update
+_NUMERIC_KEYS_BY_SECTION: dict[str, frozenset[str]] = {
+    "network_info": frozenset({
+        "signalbar",
+        "lte_rsrp",
+        "lte_rsrq",
+        "lte_rssi",
+        "lte_snr",
+        "nr5g_rsrp",
+        "nr5g_rssi",
+        "nr5g_snr",
+    }),
+    "data_usage": frozenset({
+        "real_tx_speed",
+        "real_rx_speed",
+        "real_tx_bytes",
+        "real_rx_bytes",
+    }),
+    "device_info": frozenset({"wireless_num", "lan_num"}),
+}
+
+# Headers aiohttp would add by default that the router doesn't need
+_SKIP_AUTO_HEADERS = frozenset({"Accept", "Accept-Encoding", "User-Agent"})
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _to_number(value: str) -> Any:
+    """Convert a numeric string to int or float, leaving anything else as is."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class ZTERouterAPI:
     """ZTE Router API client."""
     
-    def __init__(self, host: str, password: str | None = None) -> None:
+    def __init__(
+        self,
+        host: str,
+        password: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize the API client."""
         self.host = host
         self.password = password
+        # First hashing step doesn't depend on the salt, so do it once.
+        # hashlib.sha256 (not hashlib.new) takes OpenSSL's direct constructor.
+        self._password_hash = (
+            hashlib.sha256(password.encode()).hexdigest().upper() if password else ""
+        )
+        self._hash_cache: dict[str, str] = {}
         self.base_url = f"http://{host}/ubus/"
+        # Parsed once; only the timestamp query changes per request
+        self._base_url_obj = URL(self.base_url, encoded=True)
         self.session_id = UNAUTHENTICATED_SESSION
-        self._session: aiohttp.ClientSession | None = None
+        self._session_at = 0.0
+        # A passed-in session (e.g. Home Assistant's shared one) is never closed here
+        self._session = session
+        self._owns_session = session is None
         self._request_id = 1
+        # Update batches differ only in session and request IDs, so build them once
+        self._update_call_lists = {
+            method: self._update_calls(method)
+            for method in ("router_get_status", "router_get_status_no_auth")
+        }
+        self._update_templates = {
+            method: self._build_update_payload_template(method)
+            for method in self._update_call_lists
+        }
+        # Sent per request, since a shared session can't carry our defaults
+        self._headers = {
+            "Content-Type": "text/plain;charset=UTF-8",
+            "Origin": f"http://{host}",
+            "Referer": f"http://{host}/",
+        }
         
+    def _host_is_ip(self) -> bool:
+        """Return True if the host is an IP literal (no DNS lookup needed)."""
+        try:
+            ipaddress.ip_address(self.host)
+        except ValueError:
+            return False
+        return True
+    
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            # Create connector that doesn't verify SSL
-            connector = aiohttp.TCPConnector(ssl=False, force_close=False)
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                headers={
-                    "Content-Type": "text/plain;charset=UTF-8",
-                    "Origin": f"http://{self.host}",
-                    "Referer": f"http://{self.host}/",
-                },
+        """Get the shared session or create our own."""
+        if self._owns_session and (self._session is None or self._session.closed):
+            resolver_kwargs: dict[str, Any] = {}
+            if not self._host_is_ip() and aiodns is not None:
+                # Non-blocking c-ares lookups instead of the thread-pool resolver
+                resolver_kwargs["resolver"] = aiohttp.AsyncResolver()
+            
+            # Single plain-HTTP host: keep sockets alive past the 30s poll interval
+            connector = aiohttp.TCPConnector(
+                force_close=False,
+                keepalive_timeout=75,
+                limit=4,
+                limit_per_host=4,
+                enable_cleanup_closed=True,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                **resolver_kwargs,
             )
+            self._session = aiohttp.ClientSession(connector=connector)
         return self._session
     
     async def close(self) -> None:
-        """Close the API session."""
-        if self._session and not self._session.closed:
+        """Close the API session if we own it."""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
     
     def _create_rpc_request(
@@ -50,7 +172,7 @@ class ZTERouterAPI:
     ) -> dict[str, Any]:
         """Create a JSON-RPC 2.0 request."""
         if params is None:
-            params = {}
+            params = _EMPTY_PARAMS
         
         request = {
             "jsonrpc": "2.0",
@@ -64,118 +186,108 @@ class ZTERouterAPI:
     async def _call_api(
         self, namespace: str, method: str, params: dict[str, Any] | None = None
     ) -> dict[str, Any] | None:
-        """Make a single API call."""
-        session = await self._get_session()
-        request = self._create_rpc_request(namespace, method, params)
-        
-        # Add timestamp to URL (required by router)
-        import time
-        url = f"{self.base_url}?t={int(time.time() * 1000)}"
-        
-        try:
-            async with session.post(
-                url, 
-                json=[request], 
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                data = await response.json(content_type=None)
-                
-                # Validate response is a list
-                if not isinstance(data, list):
-                    _LOGGER.error("API returned non-list response: %s", type(data))
-                    return None
-                
-                if data and len(data) > 0:
-                    result = data[0].get("result", [])
-                    if isinstance(result, list) and len(result) > 1:
-                        return result[1]
-                
-                return None
-        except Exception as err:
-            _LOGGER.error("API call failed for %s.%s: %s", namespace, method, err)
-            return None
+        """Make a single API call (a one-element batch)."""
+        results = await self._call_api_batch([(namespace, method, params)])
+        return results[0] if results else None
     
     async def _call_api_batch(
         self, calls: list[tuple[str, str, dict[str, Any] | None]]
     ) -> list[dict[str, Any] | None]:
         """Make multiple API calls in a single request."""
-        session = await self._get_session()
         requests = [
             self._create_rpc_request(namespace, method, params)
             for namespace, method, params in calls
         ]
+        return await self._post_batch(_dumps(requests), calls)
+    
+    async def _post_batch(
+        self, payload: bytes, calls: list[tuple[str, str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any] | None]:
+        """Post a serialized batch and extract one result per call."""
+        session = await self._get_session()
         
         # Add timestamp to URL (required by router)
-        import time
-        url = f"{self.base_url}?t={int(time.time() * 1000)}"
+        url = self._base_url_obj.with_query(f"t={time_ns() // 1_000_000}")
         
         try:
             async with session.post(
                 url, 
-                json=requests, 
-                timeout=aiohttp.ClientTimeout(total=10)
+                data=payload, 
+                headers=self._headers,
+                skip_auto_headers=_SKIP_AUTO_HEADERS,
+                timeout=_REQUEST_TIMEOUT
             ) as response:
                 response.raise_for_status()
-                data = await response.json(content_type=None)
+                data = _loads(await response.read())
                 
                 # Validate response is a list
                 if not isinstance(data, list):
                     _LOGGER.error("API returned non-list response: %s (type: %s)", data, type(data))
                     return [None] * len(calls)
                 
-                results = []
-                access_denied_count = 0
+                # One slot per call, so callers can index results by call position
+                results: list[dict[str, Any] | None] = [None] * len(calls)
+                has_errors = False
                 
-                for idx, item in enumerate(data):
+                for idx, item in zip(range(len(calls)), data):
                     if not isinstance(item, dict):
-                        results.append(None)
                         continue
-                    
-                    # Check for errors in response
                     if "error" in item:
-                        error_code = item["error"].get("code")
-                        if error_code == -32002:
-                            access_denied_count += 1
-                            # Access denied is normal during session expiration, log at debug level
-                            _LOGGER.debug(
-                                "API call %d (%s.%s) returned Access Denied (session may have expired)",
-                                idx,
-                                calls[idx][0] if idx < len(calls) else "unknown",
-                                calls[idx][1] if idx < len(calls) else "unknown",
-                            )
-                        else:
-                            # Other errors are unexpected, log as warning
-                            _LOGGER.warning(
-                                "API call %d (%s.%s) returned error: %s",
-                                idx,
-                                calls[idx][0] if idx < len(calls) else "unknown",
-                                calls[idx][1] if idx < len(calls) else "unknown",
-                                item["error"]
-                            )
-                        results.append(None)
+                        has_errors = True
                         continue
-                    
-                    result = item.get("result", [])
-                    if isinstance(result, list) and len(result) > 1:
-                        results.append(result[1])
-                    else:
-                        results.append(None)
+                    rpc_result = item.get("result")
+                    if isinstance(rpc_result, list) and len(rpc_result) > 1:
+                        results[idx] = rpc_result[1]
                 
-                # If we got Access Denied on multiple calls and we're using an authenticated session,
-                # the session likely expired - reset it
-                if access_denied_count >= 2 and self.session_id != UNAUTHENTICATED_SESSION:
-                    _LOGGER.info(
-                        "Session expired (Access Denied on %d calls), resetting session for re-authentication",
-                        access_denied_count
-                    )
-                    self.session_id = UNAUTHENTICATED_SESSION
+                # Errors are rare, only classify them when some came back
+                if has_errors:
+                    self._handle_batch_errors(data, calls)
                 
                 return results
         except Exception as err:
             _LOGGER.error("Batch API call failed: %s", err)
             return [None] * len(calls)
     
+    def _handle_batch_errors(
+        self, data: list[Any], calls: list[tuple[str, str, dict[str, Any] | None]]
+    ) -> None:
+        """Log errors in a batch response and reset an expired session."""
+        access_denied_count = 0
+        
+        for idx, item in enumerate(data):
+            if not isinstance(item, dict) or "error" not in item:
+                continue
+            
+            error = item["error"]
+            namespace, method = calls[idx][:2] if idx < len(calls) else ("unknown", "unknown")
+            if isinstance(error, dict) and error.get("code") == -32002:
+                access_denied_count += 1
+                # Access denied is normal during session expiration, log at debug level
+                _LOGGER.debug(
+                    "API call %d (%s.%s) returned Access Denied (session may have expired)",
+                    idx,
+                    namespace,
+                    method,
+                )
+            else:
+                # Other errors are unexpected, log as warning
+                _LOGGER.warning(
+                    "API call %d (%s.%s) returned error: %s",
+                    idx,
+                    namespace,
+                    method,
+                    error
+                )
+        
+        # If we got Access Denied on multiple calls and we're using an authenticated session,
+        # the session likely expired - reset it
+        if access_denied_count >= 2 and self.session_id != UNAUTHENTICATED_SESSION:
+            _LOGGER.info(
+                "Session expired (Access Denied on %d calls), resetting session for re-authentication",
+                access_denied_count
+            )
+            self.session_id = UNAUTHENTICATED_SESSION
+    
     async def async_login(self) -> bool:
         """Authenticate with the router."""
         if not self.password:
@@ -192,23 +304,30 @@ class ZTERouterAPI:
             salt = login_info["zte_web_sault"]
             
             # Hash password with salt (double SHA256, uppercase at each step)
-            hashed = hashlib.sha256(self.password.encode()).hexdigest().upper()
-            hashed_with_salt = hashlib.sha256((hashed + salt).encode()).hexdigest().upper()
+            hashed_with_salt = self._hash_cache.get(salt)
+            if hashed_with_salt is None:
+                hashed_with_salt = hashlib.sha256(
+                    (self._password_hash + salt).encode("ascii")
+                ).hexdigest().upper()
+                # Only the latest salt is worth keeping
+                self._hash_cache.clear()
+                self._hash_cache[salt] = hashed_with_salt
             
             # Attempt login
             login_result = await self._call_api(
-                "zwrt_web", "web_login", {"password": hashed_with_salt.upper()}
+                "zwrt_web", "web_login", {"password": hashed_with_salt}
             )
             
             if login_result:
                 result_code = login_result.get("result")
                 
                 # Result can be string "0" or integer 0 for success
-                if result_code in ("0", 0):
+                if result_code in _LOGIN_OK:
                     self.session_id = login_result.get("ubus_rpc_session", self.session_id)
+                    self._session_at = monotonic()
                     _LOGGER.info("Successfully authenticated to ZTE router")
                     return True
-                elif result_code in (1, "1"):
+                elif result_code in _LOGIN_BAD_PASSWORD:
                     # Login failed - wrong password or other auth error
                     fail_num = login_result.get("login_fail_num", "unknown")
                     _LOGGER.error(
@@ -217,7 +336,7 @@ class ZTERouterAPI:
                         login_result.get("msg", "unknown error")
                     )
                     return False
-                elif result_code in (2, "2"):
+                elif result_code in _LOGIN_LOCKED:
                     # Login locked due to too many attempts
                     locktime = login_result.get("login_fail_lock_lefttime", "unknown")
                     _LOGGER.warning(
@@ -240,11 +359,49 @@ class ZTERouterAPI:
             _LOGGER.error("Login failed: %s", err)
             return False
     
+    @staticmethod
+    def _update_calls(router_method: str) -> list[tuple[str, str, dict[str, Any] | None]]:
+        """Return the calls made on every update."""
+        # Note: Some APIs work without auth, others require it
+        return [
+            ("zwrt_router.api", router_method, None),  # Status - works with or without auth
+            ("zte_nwinfo_api", "nwinfo_get_netinfo", None),  # Network info - works without auth
+            ("zwrt_data", "get_wwandst", _DATA_USAGE_PARAMS),  # Data usage - requires auth
+            ("zwrt_router.api", "router_get_user_list_num", None),  # Device count - requires auth
+            ("zwrt_wlan", "report", None),  # WiFi info - requires auth
+        ]
+    
+    def _build_update_payload_template(self, router_method: str) -> bytes:
+        """Serialize the update batch with placeholders for session and request IDs."""
+        return _dumps([
+            {
+                "jsonrpc": "2.0",
+                "id": f"__ID{idx}__",
+                "method": "call",
+                "params": ["__SID__", namespace, method, params or _EMPTY_PARAMS]
+            }
+            for idx, (namespace, method, params) in enumerate(self._update_call_lists[router_method])
+        ])
+    
+    def _fill_update_payload(self, router_method: str, count: int) -> bytes:
+        """Patch the current session and request IDs into the update template."""
+        payload = self._update_templates[router_method].replace(
+            b"__SID__", self.session_id.encode()
+        )
+        for idx in range(count):
+            payload = payload.replace(b'"__ID%d__"' % idx, b"%d" % self._request_id)
+            self._request_id += 1
+        return payload
+    
+    def _router_status_method(self) -> str:
+        """Return the status method, using the no_auth variant if not authenticated."""
+        if self.session_id != UNAUTHENTICATED_SESSION:
+            return "router_get_status"
+        return "router_get_status_no_auth"
+    
     async def async_get_router_status(self) -> dict[str, Any] | None:
         """Get router status information."""
-        # Use the no_auth variant if not authenticated
-        method = "router_get_status" if self.session_id != UNAUTHENTICATED_SESSION else "router_get_status_no_auth"
-        return await self._call_api("zwrt_router.api", method)
+        return await self._call_api("zwrt_router.api", self._router_status_method())
     
     async def async_get_network_info(self) -> dict[str, Any] | None:
         """Get network information (signal, operator, etc.)."""
@@ -252,39 +409,38 @@ class ZTERouterAPI:
     
     async def async_get_data_usage(self) -> dict[str, Any] | None:
         """Get data usage statistics."""
-        return await self._call_api(
-            "zwrt_data",
-            "get_wwandst",
-            {"source_module": "web", "cid": 1, "type": 4}
-        )
+        return await self._call_api("zwrt_data", "get_wwandst", _DATA_USAGE_PARAMS)
     
     async def async_update(self) -> dict[str, Any]:
         """Update all router data."""
+        # Drop an aging session so we re-login now instead of after a rejected batch.
+        # The Access Denied reset in _handle_batch_errors stays as a backstop.
+        if (
+            self.password
+            and self.session_id != UNAUTHENTICATED_SESSION
+            and monotonic() - self._session_at > SESSION_TTL
+        ):
+            _LOGGER.debug("Session older than %d seconds, re-authenticating", SESSION_TTL)
+            self.session_id = UNAUTHENTICATED_SESSION
+        
         # Authenticate if we have a password and aren't logged in yet
         if self.password and self.session_id == UNAUTHENTICATED_SESSION:
             _LOGGER.debug("Attempting to authenticate...")
             login_success = await self.async_login()
             if login_success:
-                _LOGGER.info("Authentication successful, session ID: %s", self.session_id[:8] + "...")
+                _LOGGER.info("Authentication successful, session ID: %.8s...", self.session_id)
             else:
                 _LOGGER.warning("Authentication failed, using unauthenticated access")
         
         # Determine which router status method to use
-        router_method = "router_get_status" if self.session_id != UNAUTHENTICATED_SESSION else "router_get_status_no_auth"
-        
-        _LOGGER.debug("Using method: %s, session: %s", router_method, self.session_id[:8] + "...")
+        router_method = self._router_status_method()
         
-        # Make batch call for efficiency
-        # Note: Some APIs work without auth, others require it
-        calls = [
-            ("zwrt_router.api", router_method, None),  # Status - works with or without auth
-            ("zte_nwinfo_api", "nwinfo_get_netinfo", None),  # Network info - works without auth
-            ("zwrt_data", "get_wwandst", {"source_module": "web", "cid": 1, "type": 4}),  # Data usage - requires auth
-            ("zwrt_router.api", "router_get_user_list_num", None),  # Device count - requires auth
-            ("zwrt_wlan", "report", None),  # WiFi info - requires auth
-        ]
+        _LOGGER.debug("Using method: %s, session: %.8s...", router_method, self.session_id)
         
-        results = await self._call_api_batch(calls)
+        # Make batch call for efficiency, from the prebuilt payload
+        calls = self._update_call_lists[router_method]
+        payload = self._fill_update_payload(router_method, len(calls))
+        results = await self._post_batch(payload, calls)
         
         # Check if we're missing data after the call
         missing_data = []
@@ -299,15 +455,18 @@ class ZTERouterAPI:
         if not results[4]:
             missing_data.append("wlan_info")
         
-        # Log what we got
-        _LOGGER.debug(
-            "Update results - router_status: %s, network_info: %s, data_usage: %s, device_info: %s, wlan_info: %s",
-            "OK" if results[0] else "MISSING",
-            "OK" if results[1] else "MISSING",
-            "OK" if results[2] else "MISSING",
-            "OK" if results[3] else "MISSING",
-            "OK" if results[4] else "MISSING",
-        )
+        # Log what we got (skip building the arguments unless debug is on)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Update results - router_status: %s, network_info: %s, data_usage: %s, device_info: %s, wlan_info: %s",
+                "OK" if results[0] else "MISSING",
+                "OK" if results[1] else "MISSING",
+                "OK" if results[2] else "MISSING",
+                "OK" if results[3] else "MISSING",
+                "OK" if results[4] else "MISSING",
+            )
+            if results[2]:
+                _LOGGER.debug("Speed data: TX=%s, RX=%s", results[2].get("real_tx_speed"), results[2].get("real_rx_speed"))
         
         # Warn if we're authenticated but still missing data (likely a real problem)
         if missing_data and self.session_id != UNAUTHENTICATED_SESSION:
@@ -316,13 +475,23 @@ class ZTERouterAPI:
                 ", ".join(missing_data)
             )
         
-        if results[2]:
-            _LOGGER.debug("Speed data: TX=%s, RX=%s", results[2].get("real_tx_speed"), results[2].get("real_rx_speed"))
-        
-        return {
+        data = {
             "router_status": results[0] or {},
             "network_info": results[1] or {},
             "data_usage": results[2] or {},
             "device_info": results[3] or {},
             "wlan_info": results[4] or {},
         }
+        for section, numeric_keys in _NUMERIC_KEYS_BY_SECTION.items():
+            values = data[section]
+            for key in values.keys() & numeric_keys:
+                if isinstance(values[key], str):
+                    values[key] = _to_number(values[key])
+        
+        # Single-level "section.key" view so sensors need one lookup per read
+        data["flat"] = {
+            f"{section}.{key}": value
+            for section, values in data.items()
+            for key, value in values.items()
+        }
+        return data
@@ -9,6 +9,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
 from .api import ZTERouterAPI
@@ -33,7 +34,7 @@ class ZTERouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             password = user_input.get(CONF_PASSWORD)
             
             # Test the connection
-            api = ZTERouterAPI(host, password)
+            api = ZTERouterAPI(host, password, async_get_clientsession(self.hass))
             try:
                 # Try to get router status to verify connection
                 data = await api.async_update()
@@ -41,8 +42,6 @@ class ZTERouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if not data or not any(data.values()):
                     errors["base"] = "cannot_connect"
                 else:
-                    await api.close()
-                    
                     # Create unique ID from host
                     await self.async_set_unique_id(host)
                     self._abort_if_unique_id_configured()
@@ -57,8 +56,6 @@ class ZTERouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error during setup: %s", err)
                 errors["base"] = "cannot_connect"
-            finally:
-                await api.close()
         
         data_schema = vol.Schema(
             {
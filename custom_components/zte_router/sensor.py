@@ -32,174 +32,60 @@ from .const import DOMAIN
 class ZTESensorEntityDescription(SensorEntityDescription):
     """Describes ZTE Router sensor entity."""
     
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
+    section: str | None = None
     data_key: str | None = None
+    transform: Callable[[Any], Any] | None = None
 
 
-SENSORS: tuple[ZTESensorEntityDescription, ...] = (
+def _on_off(value: Any) -> str:
+    """Map the router's "1"/"0" switch flags to On/Off."""
+    return "On" if value == "1" else "Off"
+
+
+# (key, name, section, data_key, transform, unit, device_class, state_class, icon)
+_SENSOR_SPECS: tuple[tuple[Any, ...], ...] = (
     # Network signal sensors
-    ZTESensorEntityDescription(
-        key="network_type",
-        name="Network Type",
-        icon="mdi:network",
-        value_fn=lambda data: data.get("network_info", {}).get("network_type"),
-    ),
-    ZTESensorEntityDescription(
-        key="signal_strength",
-        name="Signal Strength",
-        icon="mdi:signal",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("signalbar"),
-    ),
-    ZTESensorEntityDescription(
-        key="lte_rsrp",
-        name="LTE RSRP",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("lte_rsrp"),
-    ),
-    ZTESensorEntityDescription(
-        key="lte_rsrq",
-        name="LTE RSRQ",
-        native_unit_of_measurement="dB",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("lte_rsrq"),
-    ),
-    ZTESensorEntityDescription(
-        key="lte_rssi",
-        name="LTE RSSI",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("lte_rssi"),
-    ),
-    ZTESensorEntityDescription(
-        key="lte_snr",
-        name="LTE SNR",
-        native_unit_of_measurement="dB",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("lte_snr"),
-    ),
-    ZTESensorEntityDescription(
-        key="nr5g_rsrp",
-        name="5G RSRP",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("nr5g_rsrp"),
-    ),
-    ZTESensorEntityDescription(
-        key="nr5g_rssi",
-        name="5G RSSI",
-        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("nr5g_rssi"),
-    ),
-    ZTESensorEntityDescription(
-        key="nr5g_snr",
-        name="5G SNR",
-        native_unit_of_measurement="dB",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("network_info", {}).get("nr5g_snr"),
-    ),
+    ("network_type", "Network Type", "network_info", "network_type", None, None, None, None, "mdi:network"),
+    ("signal_strength", "Signal Strength", "network_info", "signalbar", None, None, None, SensorStateClass.MEASUREMENT, "mdi:signal"),
+    ("lte_rsrp", "LTE RSRP", "network_info", "lte_rsrp", None, SIGNAL_STRENGTH_DECIBELS_MILLIWATT, SensorDeviceClass.SIGNAL_STRENGTH, SensorStateClass.MEASUREMENT, None),
+    ("lte_rsrq", "LTE RSRQ", "network_info", "lte_rsrq", None, "dB", None, SensorStateClass.MEASUREMENT, None),
+    ("lte_rssi", "LTE RSSI", "network_info", "lte_rssi", None, SIGNAL_STRENGTH_DECIBELS_MILLIWATT, SensorDeviceClass.SIGNAL_STRENGTH, SensorStateClass.MEASUREMENT, None),
+    ("lte_snr", "LTE SNR", "network_info", "lte_snr", None, "dB", None, SensorStateClass.MEASUREMENT, None),
+    ("nr5g_rsrp", "5G RSRP", "network_info", "nr5g_rsrp", None, SIGNAL_STRENGTH_DECIBELS_MILLIWATT, SensorDeviceClass.SIGNAL_STRENGTH, SensorStateClass.MEASUREMENT, None),
+    ("nr5g_rssi", "5G RSSI", "network_info", "nr5g_rssi", None, SIGNAL_STRENGTH_DECIBELS_MILLIWATT, SensorDeviceClass.SIGNAL_STRENGTH, SensorStateClass.MEASUREMENT, None),
+    ("nr5g_snr", "5G SNR", "network_info", "nr5g_snr", None, "dB", None, SensorStateClass.MEASUREMENT, None),
     # Network info
-    ZTESensorEntityDescription(
-        key="network_provider",
-        name="Network Provider",
-        icon="mdi:network-outline",
-        value_fn=lambda data: data.get("network_info", {}).get("network_provider_fullname"),
-    ),
-    ZTESensorEntityDescription(
-        key="wan_active_band",
-        name="Active Band",
-        icon="mdi:signal-variant",
-        value_fn=lambda data: data.get("network_info", {}).get("wan_active_band"),
-    ),
-    ZTESensorEntityDescription(
-        key="nr5g_action_band",
-        name="5G Band",
-        icon="mdi:signal-5g",
-        value_fn=lambda data: data.get("network_info", {}).get("nr5g_action_band"),
-    ),
-    ZTESensorEntityDescription(
-        key="cell_id",
-        name="Cell ID",
-        icon="mdi:tower-fire",
-        value_fn=lambda data: data.get("network_info", {}).get("cell_id"),
-    ),
+    ("network_provider", "Network Provider", "network_info", "network_provider_fullname", None, None, None, None, "mdi:network-outline"),
+    ("wan_active_band", "Active Band", "network_info", "wan_active_band", None, None, None, None, "mdi:signal-variant"),
+    ("nr5g_action_band", "5G Band", "network_info", "nr5g_action_band", None, None, None, None, "mdi:signal-5g"),
+    ("cell_id", "Cell ID", "network_info", "cell_id", None, None, None, None, "mdi:tower-fire"),
     # Connection status
-    ZTESensorEntityDescription(
-        key="wireless_devices",
-        name="Wireless Devices",
-        icon="mdi:devices",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("device_info", {}).get("wireless_num"),
-    ),
-    ZTESensorEntityDescription(
-        key="lan_devices",
-        name="LAN Devices",
-        icon="mdi:lan",
-        state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("device_info", {}).get("lan_num"),
-    ),
-    ZTESensorEntityDescription(
-        key="wan_status",
-        name="WAN Status",
-        icon="mdi:wan",
-        value_fn=lambda data: data.get("router_status", {}).get("current_wan_status"),
-    ),
+    ("wireless_devices", "Wireless Devices", "device_info", "wireless_num", None, None, None, SensorStateClass.MEASUREMENT, "mdi:devices"),
+    ("lan_devices", "LAN Devices", "device_info", "lan_num", None, None, None, SensorStateClass.MEASUREMENT, "mdi:lan"),
+    ("wan_status", "WAN Status", "router_status", "current_wan_status", None, None, None, None, "mdi:wan"),
     # Data usage and speed
-    ZTESensorEntityDescription(
-        key="tx_speed",
-        name="Upload Speed",
-        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        device_class=SensorDeviceClass.DATA_RATE,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:upload",
-        value_fn=lambda data: data.get("data_usage", {}).get("real_tx_speed"),
-    ),
-    ZTESensorEntityDescription(
-        key="rx_speed",
-        name="Download Speed",
-        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
-        device_class=SensorDeviceClass.DATA_RATE,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:download",
-        value_fn=lambda data: data.get("data_usage", {}).get("real_rx_speed"),
-    ),
-    ZTESensorEntityDescription(
-        key="tx_bytes",
-        name="Uploaded Data",
-        native_unit_of_measurement=UnitOfInformation.BYTES,
-        device_class=SensorDeviceClass.DATA_SIZE,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        icon="mdi:upload",
-        value_fn=lambda data: data.get("data_usage", {}).get("real_tx_bytes"),
-    ),
-    ZTESensorEntityDescription(
-        key="rx_bytes",
-        name="Downloaded Data",
-        native_unit_of_measurement=UnitOfInformation.BYTES,
-        device_class=SensorDeviceClass.DATA_SIZE,
-        state_class=SensorStateClass.TOTAL_INCREASING,
-        icon="mdi:download",
-        value_fn=lambda data: data.get("data_usage", {}).get("real_rx_bytes"),
-    ),
+    ("tx_speed", "Upload Speed", "data_usage", "real_tx_speed", None, UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE, SensorStateClass.MEASUREMENT, "mdi:upload"),
+    ("rx_speed", "Download Speed", "data_usage", "real_rx_speed", None, UnitOfDataRate.BYTES_PER_SECOND, SensorDeviceClass.DATA_RATE, SensorStateClass.MEASUREMENT, "mdi:download"),
+    ("tx_bytes", "Uploaded Data", "data_usage", "real_tx_bytes", None, UnitOfInformation.BYTES, SensorDeviceClass.DATA_SIZE, SensorStateClass.TOTAL_INCREASING, "mdi:upload"),
+    ("rx_bytes", "Downloaded Data", "data_usage", "real_rx_bytes", None, UnitOfInformation.BYTES, SensorDeviceClass.DATA_SIZE, SensorStateClass.TOTAL_INCREASING, "mdi:download"),
     # WiFi
-    ZTESensorEntityDescription(
-        key="wifi_status",
-        name="WiFi Status",
-        icon="mdi:wifi",
-        value_fn=lambda data: "On" if data.get("wlan_info", {}).get("wifi_onoff") == "1" else "Off",
-    ),
-    ZTESensorEntityDescription(
-        key="ssid",
-        name="SSID",
-        icon="mdi:wifi-settings",
-        value_fn=lambda data: data.get("wlan_info", {}).get("main2g_ssid"),
-    ),
+    ("wifi_status", "WiFi Status", "wlan_info", "wifi_onoff", _on_off, None, None, None, "mdi:wifi"),
+    ("ssid", "SSID", "wlan_info", "main2g_ssid", None, None, None, None, "mdi:wifi-settings"),
+)
+
+SENSORS: tuple[ZTESensorEntityDescription, ...] = tuple(
+    ZTESensorEntityDescription(
+        key=key,
+        name=name,
+        section=section,
+        data_key=data_key,
+        transform=transform,
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        state_class=state_class,
+        icon=icon,
+    )
+    for key, name, section, data_key, transform, unit, device_class, state_class, icon in _SENSOR_SPECS
 )
 
 
@@ -241,25 +127,26 @@ class ZTERouterSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "ZTE",
             "model": "Mobile Router",
         }
+        self._flat_key = (
+            f"{description.section}.{description.data_key}"
+            if description.section and description.data_key
+            else None
+        )
+        self._transform = description.transform
     
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.entity_description.value_fn:
-            value = self.entity_description.value_fn(self.coordinator.data)
+        if self._flat_key:
+            value = self.coordinator.data["flat"].get(self._flat_key)
+            if self._transform:
+                value = self._transform(value)
             
             # Skip if value is None, empty string, or 0 for optional sensors
             if value is None or value == "":
                 return None
             
-            # Convert string numbers to appropriate types
-            if isinstance(value, str):
-                # Try to convert to float for numeric values
-                try:
-                    return float(value)
-                except ValueError:
-                    return value
-            
+            # Numeric fields are already converted by the API on each update
             return value
         
         return None